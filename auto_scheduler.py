@@ -8,69 +8,114 @@ import subprocess
 # This section runs BEFORE other imports to ensure the virtual environment
 # exists and dependencies are installed. On first run, it will:
 # 1. Create a virtual environment in the script directory
-# 2. Install required dependencies (aiohttp)
+# 2. Install required dependencies (aiohttp, plus optional orjson)
 # 3. Re-launch itself inside the virtual environment
 # ============================================================================
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 VENV_DIR = os.path.join(SCRIPT_DIR, ".venv")
 
+# Venv executables, resolved once at startup
+if os.name == 'nt':  # Windows
+    VENV_PYTHON = os.path.join(VENV_DIR, "Scripts", "python.exe")
+    VENV_PIP = os.path.join(VENV_DIR, "Scripts", "pip.exe")
+else:  # Linux/Termux/Mac
+    VENV_PYTHON = os.path.join(VENV_DIR, "bin", "python")
+    VENV_PIP = os.path.join(VENV_DIR, "bin", "pip")
+
+# Packages installed into the venv (optional ones may fail to install)
+REQUIREMENTS = ["aiohttp"]
+OPTIONAL_REQUIREMENTS = ["orjson"]
+
+# Requirement list, recorded in the venv once installed so the install step
+# is skipped until the list changes (short enough to compare as-is, no hash)
+REQS_STAMP_FILE = os.path.join(VENV_DIR, ".reqs_stamp")
+REQS_STAMP = "\n".join(REQUIREMENTS + OPTIONAL_REQUIREMENTS) + "\n"
+
 def is_in_venv():
     """Check if we're running inside a virtual environment"""
     return (hasattr(sys, 'real_prefix') or 
             (hasattr(sys, 'base_prefix') and sys.base_prefix != sys.prefix))
 
-def get_venv_python():
-    """Get the path to the Python executable inside the venv"""
-    if os.name == 'nt':  # Windows
-        return os.path.join(VENV_DIR, "Scripts", "python.exe")
-    else:  # Linux/Termux/Mac
-        return os.path.join(VENV_DIR, "bin", "python")
+def is_venv_python():
+    """Check if we're already running the venv's own interpreter"""
+    # Compare the unresolved paths - realpath() on the venv python would follow
+    # its symlink back to the base interpreter and match from outside the venv
+    return (os.path.abspath(sys.executable) == os.path.abspath(VENV_PYTHON) or
+            os.path.realpath(sys.prefix) == os.path.realpath(VENV_DIR))
+
+def _setup_failed(error):
+    """Print manual install instructions and exit"""
+    print(f"❌ Setup failed: {error}")
+    print("Please install manually:")
+    print("  python -m venv .venv")
+    print("  .venv\\Scripts\\pip install aiohttp  (Windows)")
+    print("  .venv/bin/pip install aiohttp  (Linux/Termux)")
+    sys.exit(1)
+
+def create_venv():
+    """Create the virtual environment"""
+    print("=" * 55)
+    print("🔧 FIRST-TIME SETUP - Creating virtual environment...")
+    print("=" * 55)
+    
+    try:
+        print("📦 Creating venv...")
+        subprocess.run([sys.executable, "-m", "venv", VENV_DIR], check=True)
+        print("✅ Virtual environment created!")
+        
+        # A stamp left over in a partial .venv/ must not skip the install
+        if os.path.exists(REQS_STAMP_FILE):
+            os.remove(REQS_STAMP_FILE)
+    except subprocess.CalledProcessError as e:
+        _setup_failed(e)
+
+def read_requirements_stamp():
+    """Get the requirement list recorded in the venv (None if missing)"""
+    try:
+        with open(REQS_STAMP_FILE, 'r') as f:
+            return f.read()
+    except OSError:
+        return None
 
-def get_venv_pip():
-    """Get the path to pip inside the venv"""
-    if os.name == 'nt':  # Windows
-        return os.path.join(VENV_DIR, "Scripts", "pip.exe")
-    else:  # Linux/Termux/Mac
-        return os.path.join(VENV_DIR, "bin", "pip")
+def install_requirements():
+    """Install dependencies into the venv and record the requirement list"""
+    try:
+        print(f"📥 Installing {', '.join(REQUIREMENTS)}...")
+        subprocess.run([VENV_PIP, "install", "--quiet"] + REQUIREMENTS, check=True)
+        
+        # Optional extras may not build everywhere (e.g. orjson on Termux)
+        for package in OPTIONAL_REQUIREMENTS:
+            print(f"📥 Installing {package} (optional)...")
+            result = subprocess.run([VENV_PIP, "install", "--quiet", package])
+            if result.returncode != 0:
+                print(f"⚠️ {package} unavailable, continuing without it")
+        print("✅ Dependencies installed!")
+        print("-" * 55)
+    except subprocess.CalledProcessError as e:
+        _setup_failed(e)
+    
+    with open(REQS_STAMP_FILE, 'w') as f:
+        f.write(REQS_STAMP)
 
 def setup_environment():
     """Create venv and install dependencies if needed"""
-    venv_python = get_venv_python()
+    # Check if venv exists (a single stat, no separate exists() call)
+    try:
+        os.stat(VENV_PYTHON)
+    except FileNotFoundError:
+        create_venv()
     
-    # Check if venv exists
-    if not os.path.exists(venv_python):
-        print("=" * 55)
-        print("🔧 FIRST-TIME SETUP - Creating virtual environment...")
-        print("=" * 55)
-        
-        try:
-            # Create virtual environment
-            print("📦 Creating venv...")
-            subprocess.run([sys.executable, "-m", "venv", VENV_DIR], check=True)
-            print("✅ Virtual environment created!")
-            
-            # Install dependencies
-            print("📥 Installing aiohttp...")
-            pip_path = get_venv_pip()
-            subprocess.run([pip_path, "install", "--quiet", "aiohttp"], check=True)
-            print("✅ Dependencies installed!")
-            print("-" * 55)
-            
-        except subprocess.CalledProcessError as e:
-            print(f"❌ Setup failed: {e}")
-            print("Please install manually:")
-            print("  python -m venv .venv")
-            print("  .venv\\Scripts\\pip install aiohttp  (Windows)")
-            print("  .venv/bin/pip install aiohttp  (Linux/Termux)")
-            sys.exit(1)
+    # (Re)install dependencies only when the requirement list has changed
+    if read_requirements_stamp() != REQS_STAMP:
+        install_requirements()
     
     # If we're not in the venv, re-launch inside it
-    if not is_in_venv():
+    if not is_in_venv() and not is_venv_python():
         print("🔄 Launching inside virtual environment...")
         # Pass all original arguments
-        args = [venv_python] + sys.argv
-        os.execv(venv_python, args)
+        args = [VENV_PYTHON] + sys.argv
+        os.execv(VENV_PYTHON, args)
 
 # Run environment setup BEFORE importing other dependencies
 setup_environment()
@@ -78,15 +123,15 @@ setup_environment()
 # ============================================================================
 # Now safe to import dependencies that require installation
 # ============================================================================
-import asyncio
-import aiohttp
-import uuid
+# Heavy modules (asyncio, aiohttp, json, getpass) are imported lazily
+# inside the functions that need them, so wake-ups that only sleep don't pay
+# for them on every launch.
 import time
 import random
 import signal
-import json
-from datetime import datetime, timedelta, timezone
-from getpass import getpass
+import select
+import errno
+from collections import namedtuple
 
 # ============================================================================
 # TERMUX/ANDROID BATTERY OPTIMIZED SCHEDULER
@@ -103,6 +148,9 @@ from getpass import getpass
 # Config file path (stored in same directory as script)
 CONFIG_FILE = os.path.join(SCRIPT_DIR, ".auth_config")
 
+# Scheduler state file (last executed interval, survives restarts)
+STATE_FILE = os.path.join(SCRIPT_DIR, ".sched_state")
+
 # User token - loaded from config file
 USER_TOKEN = None
 
@@ -122,18 +170,143 @@ STARTUP_CHANNEL_ID = "1297294853935206512"
 # All available tags
 TAGS = ["feed", "tame", "edge", "hev", "city" , "dead"]
 
+# Request headers, built once (Authorization is filled in by load_auth_token)
+_USER_AGENT = "Mozilla/5.0 (Linux; Android 10; K) AppleWebKit/537.36"
+_STARTUP_HEADERS = {
+    "Authorization": None,
+    "Content-Type": "application/json",
+    "User-Agent": _USER_AGENT
+}
+_NUDGE_HEADERS = {
+    "Authorization": None,
+    "Content-Type": "application/json",
+    "User-Agent": _USER_AGENT,
+    "Accept": "*/*",
+    "Origin": "https://discord.com"
+}
+
+# Nudge payload per tag, built once - only session_id and nonce change per send
+_TAG_PAYLOADS = {
+    tag: {
+        "type": 2,
+        "application_id": BOT_APPLICATION_ID,
+        "guild_id": TARGET_GUILD_ID,
+        "channel_id": TARGET_CHANNEL_ID,
+        "session_id": None,
+        "data": {
+            "version": NUDGE_COMMAND_VERSION,
+            "id": NUDGE_COMMAND_ID,
+            "name": "nudge",
+            "type": 1,
+            "options": [{"type": 3, "name": "tag", "value": tag}]
+        },
+        "nonce": None,
+        "analytics_location": "slash_ui"
+    }
+    for tag in TAGS
+}
+
 # Termux detection
 IS_TERMUX = os.path.exists('/data/data/com.termux')
 
+# aiohttp module, imported on first network use
+_AIOHTTP = None
+
+def _aiohttp():
+    """Import aiohttp on first use and memoize the module"""
+    global _AIOHTTP
+    if _AIOHTTP is None:
+        import aiohttp
+        _AIOHTTP = aiohttp
+    return _AIOHTTP
+
+# Shared aiohttp session and event loop for the nudge path. Keep-alive
+# connections are reused within a nudge burst; they idle out long before the
+# next burst, but the session and its DNS cache are kept
+_SESSION = None
+_LOOP = None
+
+async def _session():
+    """Get the shared aiohttp session, creating it on first use"""
+    global _SESSION
+    if _SESSION is None or _SESSION.closed:
+        aiohttp = _aiohttp()
+        connector = aiohttp.TCPConnector(limit=2, keepalive_timeout=300, ttl_dns_cache=3600)
+        _SESSION = aiohttp.ClientSession(connector=connector)
+    return _SESSION
+
+def run_async(coro):
+    """Run a coroutine on the shared event loop"""
+    global _LOOP
+    if _LOOP is None:
+        import asyncio
+        _LOOP = asyncio.new_event_loop()
+    try:
+        if _SIGNAL_FD is None:
+            return _LOOP.run_until_complete(coro)
+        # Watch the signalfd while the burst runs, so a shutdown signal
+        # cancels it right away instead of waiting out stalled requests
+        task = _LOOP.create_task(coro)
+        _LOOP.add_reader(_SIGNAL_FD, _cancel_on_signal, task)
+        try:
+            return _LOOP.run_until_complete(task)
+        finally:
+            _LOOP.remove_reader(_SIGNAL_FD)
+    except BaseException:
+        # Interrupted mid-burst (e.g. by a shutdown signal) - don't leave the
+        # session, connector and loop open on the way out
+        close_session()
+        raise
+
+def close_session():
+    """Close the shared aiohttp session and event loop"""
+    global _SESSION, _LOOP
+    # Can't block on the loop from a signal handler that interrupted it;
+    # run_async closes everything once the interrupted run has unwound
+    if _LOOP is None or _LOOP.is_running():
+        return
+    import asyncio
+    try:
+        # Cancel whatever an interrupted nudge burst left behind
+        pending = asyncio.all_tasks(_LOOP)
+        for task in pending:
+            task.cancel()
+        if pending:
+            _LOOP.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+        if _SESSION is not None and not _SESSION.closed:
+            _LOOP.run_until_complete(_SESSION.close())
+        _LOOP.run_until_complete(_LOOP.shutdown_default_executor())
+    except Exception as e:
+        log(f"⚠️ Session close failed: {e}", "WARN")
+    _LOOP.close()
+    _SESSION = None
+    _LOOP = None
+
+# [epoch second, formatted timestamp] of the last log line
+_LAST_TS_BUCKET = [0, ""]
+
 def log(message, level="INFO"):
     """Battery-efficient logging with timestamps"""
-    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    # Only reformat the timestamp when the second changes
+    now = int(time.time())
+    bucket = _LAST_TS_BUCKET
+    if now != bucket[0]:
+        bucket[0] = now
+        bucket[1] = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(now))
+    timestamp = bucket[1]
+    # No flush here - output is flushed in batches before the CPU goes idle
     print(f"[{timestamp}] [{level}] {message}")
-    sys.stdout.flush()  # Ensure output is written immediately
+
+def _apply_auth_token():
+    """Patch the loaded token into the prebuilt request headers"""
+    _STARTUP_HEADERS["Authorization"] = USER_TOKEN
+    _NUDGE_HEADERS["Authorization"] = USER_TOKEN
 
 def load_auth_token():
     """Load auth token from config file, or prompt user if not found"""
     global USER_TOKEN
+    import json
+    from getpass import getpass
     
     # Try to load from config file
     if os.path.exists(CONFIG_FILE):
@@ -142,6 +315,7 @@ def load_auth_token():
                 config = json.load(f)
                 USER_TOKEN = config.get('auth_token')
                 if USER_TOKEN:
+                    _apply_auth_token()
                     log("🔑 Auth token loaded from config", "AUTH")
                     return True
         except Exception as e:
@@ -163,6 +337,8 @@ def load_auth_token():
             log("❌ No token provided. Exiting.", "AUTH")
             sys.exit(1)
         
+        _apply_auth_token()
+        
         # Save to config file
         save_auth_token(USER_TOKEN)
         log("✅ Auth token saved successfully!", "AUTH")
@@ -176,6 +352,7 @@ def load_auth_token():
 
 def save_auth_token(token):
     """Save auth token to config file"""
+    import json
     try:
         config = {'auth_token': token}
         with open(CONFIG_FILE, 'w') as f:
@@ -201,11 +378,57 @@ def reset_auth_token():
             log(f"⚠️ Error deleting config: {e}", "WARN")
     return False
 
+# Whether we currently hold the Termux wake-lock
+_wakelock_held = False
+
+def _run_termux_command(command, timeout=5):
+    """
+    Run a termux-api helper with its output discarded.
+    Uses posix_spawn (vfork + exec on Linux) instead of subprocess.run so the
+    Python heap isn't duplicated just to start a tiny helper.
+    The helper starts with an empty signal mask rather than inheriting the
+    block set up for the signalfd.
+    """
+    # Bionic only exports posix_spawn from API 28, and Termux builds against
+    # an older API level, so os.posix_spawnp may be missing there
+    if not hasattr(os, 'posix_spawnp'):
+        if _SIGNAL_FD is None:
+            return subprocess.run([command], timeout=timeout, capture_output=True).returncode
+        # subprocess has no sigmask option, so unblock around the fork; a
+        # signal landing in this window goes to the shutdown() handlers
+        old_mask = signal.pthread_sigmask(signal.SIG_UNBLOCK, _SIGNALFD_SIGNALS)
+        try:
+            return subprocess.run([command], timeout=timeout, capture_output=True).returncode
+        finally:
+            signal.pthread_sigmask(signal.SIG_SETMASK, old_mask)
+    
+    file_actions = [
+        (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+        (os.POSIX_SPAWN_DUP2, 1, 2),
+    ]
+    pid = os.posix_spawnp(command, [command], os.environ,
+                          file_actions=file_actions, setsigmask=())
+    
+    deadline = time.monotonic() + timeout
+    while True:
+        done, status = os.waitpid(pid, os.WNOHANG)
+        if done:
+            return os.waitstatus_to_exitcode(status)
+        if time.monotonic() >= deadline:
+            os.kill(pid, signal.SIGKILL)
+            os.waitpid(pid, 0)
+            raise TimeoutError(f"{command} timed out after {timeout}s")
+        time.sleep(0.05)
+
 def acquire_wakelock():
     """Acquire Termux partial wake-lock to prevent CPU sleep during operations"""
+    global _wakelock_held
     if IS_TERMUX:
+        if _wakelock_held:
+            return True
         try:
-            subprocess.run(['termux-wake-lock'], timeout=5, capture_output=True)
+            _run_termux_command('termux-wake-lock')
+            _wakelock_held = True
             log("🔒 Wake-lock acquired", "POWER")
             return True
         except Exception as e:
@@ -214,148 +437,145 @@ def acquire_wakelock():
 
 def release_wakelock():
     """Release Termux wake-lock to allow CPU to sleep"""
-    if IS_TERMUX:
+    global _wakelock_held
+    if IS_TERMUX and _wakelock_held:
         try:
-            subprocess.run(['termux-wake-unlock'], timeout=5, capture_output=True)
+            _run_termux_command('termux-wake-unlock')
+            _wakelock_held = False
             log("🔓 Wake-lock released", "POWER")
             return True
         except Exception as e:
             log(f"⚠️ Wake-unlock failed: {e}", "WARN")
     return False
 
-def is_war_day_active():
+# Schedule arithmetic is done in plain epoch seconds (no datetime objects)
+SECONDS_PER_DAY = 86400
+DAY_START_OFFSET = 10 * 3600  # Battle days roll over at 10:00 UTC (15:30 IST)
+IST_OFFSET = 5 * 3600 + 30 * 60
+
+def _compute_clock_context():
+    """
+    Snapshot the clock once per scheduler tick.
+    Returns (now, day_start, hours_in_cycle, weekday) in epoch seconds, where
+    day_start is the most recent 10:00 UTC battle day boundary.
+    """
+    now = time.time()
+    
+    # Most recent 10:00 UTC (today, or yesterday if before 10:00)
+    day_start = ((int(now) - DAY_START_OFFSET) // SECONDS_PER_DAY) * SECONDS_PER_DAY + DAY_START_OFFSET
+    hours_in_cycle = (now - day_start) / 3600
+    
+    # 1970-01-01 was a Thursday (weekday 3, Monday = 0)
+    weekday = (int(now) // SECONDS_PER_DAY + 3) % 7
+    
+    return now, day_start, hours_in_cycle, weekday
+
+# Battle Days: Thursday 15:30 IST to Monday 15:30 IST
+# Each battle day transitions at 15:30 IST (10:00 UTC)
+# Indexed by weekday * 2 + (hour >= 10 UTC), Monday = 0 ... Sunday = 6.
+# A None label means Training Day (label is built from the current IST time).
+_WAR_TABLE = (
+    (True, "Battle Day 4: ends @ 15:30 IST"),   # Mon before 10:00 UTC
+    (False, None),                              # Mon after 10:00 UTC
+    (False, None),                              # Tue
+    (False, None),
+    (False, None),                              # Wed
+    (False, None),
+    (False, None),                              # Thu before 10:00 UTC
+    (True, "Battle Day 1: Thursday"),           # Thu after 10:00 UTC
+    (True, "Battle Day 1: ends @ 15:30 IST"),   # Fri
+    (True, "Battle Day 2: Friday"),
+    (True, "Battle Day 2: ends @ 15:30 IST"),   # Sat
+    (True, "Battle Day 3: Saturday"),
+    (True, "Battle Day 3: ends @ 15:30 IST"),   # Sun
+    (True, "Battle Day 4: Sunday"),
+)
+
+class _LazyStatus:
+    """Status label that is only formatted when it's actually printed"""
+    __slots__ = ("_fn",)
+    
+    def __init__(self, fn):
+        self._fn = fn
+    
+    def __str__(self):
+        return self._fn()
+
+def is_war_day_active(ctx=None):
     """Check if current time is during Clash Royale Battle Days (Thu-Mon at 15:30 IST transitions)"""
-    now_utc = datetime.now(timezone.utc)
-    now_ist = now_utc + timedelta(hours=5, minutes=30)  # Convert to IST
-    current_weekday = now_utc.weekday()
-    current_hour = now_utc.hour
-    
-    # Battle Days: Thursday 15:30 IST to Monday 15:30 IST
-    # Each battle day transitions at 15:30 IST (10:00 UTC)
-    # Thursday = 3, Friday = 4, Saturday = 5, Sunday = 6, Monday = 0
-    
-    # Battle Day 1: Thu 15:30 IST → Fri 15:30 IST
-    if current_weekday == 3 and current_hour >= 10:
-        return True, "Battle Day 1: Thursday"
-    elif current_weekday == 4 and current_hour < 10:
-        return True, "Battle Day 1: ends @ 15:30 IST"
-    
-    # Battle Day 2: Fri 15:30 IST → Sat 15:30 IST
-    elif current_weekday == 4 and current_hour >= 10:
-        return True, "Battle Day 2: Friday"
-    elif current_weekday == 5 and current_hour < 10:
-        return True, "Battle Day 2: ends @ 15:30 IST"
-    
-    # Battle Day 3: Sat 15:30 IST → Sun 15:30 IST
-    elif current_weekday == 5 and current_hour >= 10:
-        return True, "Battle Day 3: Saturday"
-    elif current_weekday == 6 and current_hour < 10:
-        return True, "Battle Day 3: ends @ 15:30 IST"
-    
-    # Battle Day 4: Sun 15:30 IST → Mon 15:30 IST
-    elif current_weekday == 6 and current_hour >= 10:
-        return True, "Battle Day 4: Sunday"
-    elif current_weekday == 0 and current_hour < 10:
-        return True, "Battle Day 4: ends @ 15:30 IST"
+    now, _, _, current_weekday = ctx or _compute_clock_context()
+    
+    after_rollover = now % SECONDS_PER_DAY >= DAY_START_OFFSET
+    active, label = _WAR_TABLE[current_weekday * 2 + after_rollover]
+    if active:
+        return True, label
     
     # Training Days: Mon 15:30 IST → Thu 15:30 IST
-    else:
-        return False, f"Training Day ({now_ist.strftime('%A %H:%M')} IST)"
-
-def get_current_interval_hours():
-    """Get current nudge interval based on battle day phase"""
-    now_utc = datetime.now(timezone.utc)
-    
-    # Calculate hours since 10:00 UTC today (or yesterday if before 10:00)
-    if now_utc.hour >= 10:
-        day_start = now_utc.replace(hour=10, minute=0, second=0, microsecond=0)
-    else:
-        day_start = (now_utc - timedelta(days=1)).replace(hour=10, minute=0, second=0, microsecond=0)
-    
-    hours_elapsed = (now_utc - day_start).total_seconds() / 3600
-    hours_in_cycle = hours_elapsed % 24
-    
-    if hours_in_cycle < 12:
-        return 3, "early phase (every 3h)"
-    elif hours_in_cycle < 18:
-        return 2, "mid phase (every 2h)"
-    else:
-        return 1, "final phase (every 1h)"
-
-def get_next_battle_day_start():
+    def training_label():
+        now_ist = time.gmtime(now + IST_OFFSET)  # Convert to IST
+        return f"Training Day ({time.strftime('%A %H:%M', now_ist)} IST)"
+    return False, _LazyStatus(training_label)
+
+def get_next_battle_day_start(ctx=None):
     """Calculate seconds until next Battle Day starts (Thursday 10:00 UTC)"""
-    now_utc = datetime.now(timezone.utc)
+    now, _, _, current_weekday = ctx or _compute_clock_context()
     
     # Find next Thursday 10:00 UTC
-    days_until_thursday = (3 - now_utc.weekday()) % 7
-    if days_until_thursday == 0 and now_utc.hour >= 10:
+    days_until_thursday = (3 - current_weekday) % 7
+    if days_until_thursday == 0 and now % SECONDS_PER_DAY >= DAY_START_OFFSET:
         days_until_thursday = 7
     
-    next_thursday = now_utc.replace(hour=10, minute=0, second=0, microsecond=0) + timedelta(days=days_until_thursday)
+    midnight = (int(now) // SECONDS_PER_DAY) * SECONDS_PER_DAY
+    next_thursday = midnight + days_until_thursday * SECONDS_PER_DAY + DAY_START_OFFSET
     
-    seconds_until = (next_thursday - now_utc).total_seconds()
+    seconds_until = next_thursday - now
     return max(seconds_until, 60)  # Minimum 60 seconds
 
-def get_next_phase_change():
-    """Calculate seconds until next phase change (12h, 18h, or 24h mark)"""
-    now_utc = datetime.now(timezone.utc)
-    
-    if now_utc.hour >= 10:
-        day_start = now_utc.replace(hour=10, minute=0, second=0, microsecond=0)
-    else:
-        day_start = (now_utc - timedelta(days=1)).replace(hour=10, minute=0, second=0, microsecond=0)
-    
-    hours_elapsed = (now_utc - day_start).total_seconds() / 3600
-    hours_in_cycle = hours_elapsed % 24
-    
-    # Phase boundaries at 12h, 18h, 24h
-    if hours_in_cycle < 12:
-        next_boundary = 12
-    elif hours_in_cycle < 18:
-        next_boundary = 18
-    else:
-        next_boundary = 24
-    
-    seconds_until_phase = (next_boundary - hours_in_cycle) * 3600
-    return max(seconds_until_phase, 60)
-
-# Global variable to track last executed interval
-_last_executed_interval = None
+# Everything the scheduler needs to know about the current battle day phase
+PhaseState = namedtuple('PhaseState', [
+    'interval_id',               # unique id of the current interval
+    'interval_hours',            # 3 (early), 2 (mid) or 1 (final)
+    'seconds_to_next_phase',     # until the 12h, 18h or 24h mark (min 60s)
+    'seconds_to_next_interval',  # until the next interval starts
+])
 
-def get_current_interval_id():
+def _phase_state(ctx=None):
     """
-    Get a unique identifier for the current interval.
-    Returns (interval_number, interval_hours) where interval_number changes each time we enter a new interval.
+    Work out the current phase, interval and upcoming boundaries in one pass.
+    Pure function of the clock snapshot, so it can be checked for any time.
     """
-    now_utc = datetime.now(timezone.utc)
-    
-    # Calculate day start (10:00 UTC)
-    if now_utc.hour >= 10:
-        day_start = now_utc.replace(hour=10, minute=0, second=0, microsecond=0)
-    else:
-        day_start = (now_utc - timedelta(days=1)).replace(hour=10, minute=0, second=0, microsecond=0)
+    now, day_start, hours_in_cycle, _ = ctx or _compute_clock_context()
     
-    hours_since_day_start = (now_utc - day_start).total_seconds() / 3600
-    hours_in_cycle = hours_since_day_start % 24
-    
-    # Determine current phase and interval
+    # Determine current phase, interval and next phase boundary (12h, 18h, 24h)
     if hours_in_cycle < 12:  # Early phase: every 3 hours
         interval_hours = 3
         interval_num = int(hours_in_cycle // 3)
+        next_boundary = 12
     elif hours_in_cycle < 18:  # Mid phase: every 2 hours
         interval_hours = 2
         interval_num = 4 + int((hours_in_cycle - 12) // 2)  # 4-6
+        next_boundary = 18
     else:  # Final phase: every 1 hour
         interval_hours = 1
         interval_num = 7 + int((hours_in_cycle - 18) // 1)  # 7-12
+        next_boundary = 24
     
     # Create unique interval ID (includes day to avoid cross-day confusion)
-    day_id = day_start.strftime('%Y%m%d')
+    day_id = time.strftime('%Y%m%d', time.gmtime(day_start))
     interval_id = f"{day_id}_{interval_num}"
     
-    return interval_id, interval_hours
+    seconds_since_day_start = now - day_start
+    seconds_to_next_phase = max(next_boundary * 3600 - seconds_since_day_start, 60)
+    
+    interval_seconds = interval_hours * 3600
+    seconds_to_next_interval = interval_seconds - seconds_since_day_start % interval_seconds
+    
+    return PhaseState(interval_id, interval_hours, seconds_to_next_phase, seconds_to_next_interval)
+
+# Global variable to track last executed interval
+_last_executed_interval = None
 
-def calculate_sleep_duration():
+def calculate_sleep_duration(ctx=None):
     """
     Calculate optimal sleep duration for battery efficiency.
     Returns (sleep_seconds, reason, should_execute_now)
@@ -365,18 +585,19 @@ def calculate_sleep_duration():
     trying to hit a tiny 2-minute window.
     """
     global _last_executed_interval
+    ctx = ctx or _compute_clock_context()
     
-    active, status = is_war_day_active()
+    active, status = is_war_day_active(ctx)
     
     if not active:
         # Sleep until next Battle Day - maximum battery savings
         _last_executed_interval = None  # Reset on training days
-        sleep_secs = get_next_battle_day_start()
+        sleep_secs = get_next_battle_day_start(ctx)
         return sleep_secs, f"Training day - sleeping until next Battle Day", False
     
     # During Battle Days, check if we need to execute
-    current_interval, interval_hours = get_current_interval_id()
-    interval_seconds = interval_hours * 3600
+    state = _phase_state(ctx)
+    current_interval, interval_hours = state.interval_id, state.interval_hours
     phase = f"{'early' if interval_hours == 3 else 'mid' if interval_hours == 2 else 'final'} phase (every {interval_hours}h)"
     
     # Check if we've already executed in this interval
@@ -385,19 +606,10 @@ def calculate_sleep_duration():
         return 0, f"{phase} - Execute now (interval: {current_interval})", True
     
     # Already executed in this interval, calculate time until next interval
-    now_utc = datetime.now(timezone.utc)
-    
-    if now_utc.hour >= 10:
-        day_start = now_utc.replace(hour=10, minute=0, second=0, microsecond=0)
-    else:
-        day_start = (now_utc - timedelta(days=1)).replace(hour=10, minute=0, second=0, microsecond=0)
-    
-    seconds_since_day_start = (now_utc - day_start).total_seconds()
-    seconds_into_interval = seconds_since_day_start % interval_seconds
-    seconds_until_next = interval_seconds - seconds_into_interval
+    seconds_until_next = state.seconds_to_next_interval
     
     # Also check if phase will change before next interval
-    phase_change_seconds = get_next_phase_change()
+    phase_change_seconds = state.seconds_to_next_phase
     
     # Use whichever comes first
     if phase_change_seconds < seconds_until_next:
@@ -405,98 +617,274 @@ def calculate_sleep_duration():
     
     return seconds_until_next, f"{phase} - Next action in {seconds_until_next/60:.0f}min", False
 
-def mark_interval_executed():
+def load_scheduler_state():
+    """Restore the last executed interval so a restart doesn't re-run it"""
+    global _last_executed_interval
+    import json
+    try:
+        with open(STATE_FILE, 'r') as f:
+            _last_executed_interval = json.load(f).get('last_interval')
+        if _last_executed_interval:
+            log(f"📂 Last executed interval: {_last_executed_interval}", "SCHED")
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        log(f"⚠️ Error reading scheduler state: {e}", "WARN")
+
+def save_scheduler_state():
+    """Atomically persist the last executed interval"""
+    import json
+    tmp_file = STATE_FILE + ".tmp"
+    try:
+        with open(tmp_file, 'w') as f:
+            json.dump({'last_interval': _last_executed_interval}, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, STATE_FILE)
+        return True
+    except Exception as e:
+        log(f"⚠️ Error saving scheduler state: {e}", "WARN")
+        return False
+
+def mark_interval_executed(ctx=None):
     """Mark the current interval as executed"""
     global _last_executed_interval
-    current_interval, _ = get_current_interval_id()
-    _last_executed_interval = current_interval
+    current_interval = _phase_state(ctx).interval_id
+    # Only touch the disk when the interval actually changes
+    if current_interval != _last_executed_interval:
+        _last_executed_interval = current_interval
+        save_scheduler_state()
     log(f"✅ Marked interval {current_interval} as executed", "SCHED")
 
-async def send_startup_message():
+def send_startup_message():
     """Send startup notification"""
-    headers = {
-        "Authorization": USER_TOKEN,
-        "Content-Type": "application/json",
-        "User-Agent": "Mozilla/5.0 (Linux; Android 10; K) AppleWebKit/537.36"
-    }
-    
+    # A single tiny POST - plain http.client avoids importing asyncio and
+    # aiohttp (and spinning up an event loop) on every launch
+    import http.client
     try:
-        async with aiohttp.ClientSession() as session:
-            url = f"https://discord.com/api/v10/channels/{STARTUP_CHANNEL_ID}/messages"
-            async with session.post(url, json={"content": "hi"}, headers=headers) as response:
-                if response.status in [200, 204]:
-                    log("👋 Startup message sent", "NET")
-                else:
-                    log(f"⚠️ Startup failed: {response.status}", "WARN")
+        conn = http.client.HTTPSConnection("discord.com", timeout=30)
+        try:
+            conn.request("POST", f"/api/v10/channels/{STARTUP_CHANNEL_ID}/messages",
+                         body=b'{"content": "hi"}', headers=_STARTUP_HEADERS)
+            response = conn.getresponse()
+            response.read()
+        finally:
+            conn.close()
+        
+        if response.status in [200, 204]:
+            log("👋 Startup message sent", "NET")
+        else:
+            log(f"⚠️ Startup failed: {response.status}", "WARN")
     except Exception as e:
         log(f"⚠️ Startup error: {e}", "WARN")
 
+# JSON encoder for request bodies, picked on first use
+_JSON_DUMPS = None
+
+def _json_dumps(obj):
+    """Serialize a request body to bytes, using orjson when it's installed"""
+    global _JSON_DUMPS
+    if _JSON_DUMPS is None:
+        try:
+            import orjson
+            _JSON_DUMPS = orjson.dumps
+        except ImportError:
+            import json
+            _JSON_DUMPS = lambda o: json.dumps(o, separators=(',', ':')).encode()
+    return _JSON_DUMPS(obj)
+
 async def send_nudge_interaction(session, tag_value, attempt_num, headers):
     """Send a single nudge command"""
     try:
-        session_id = str(uuid.uuid4()).replace('-', '')
-        nonce = str(int(datetime.now().timestamp() * 1000000))
-        
-        payload = {
-            "type": 2,
-            "application_id": BOT_APPLICATION_ID,
-            "guild_id": TARGET_GUILD_ID,
-            "channel_id": TARGET_CHANNEL_ID,
-            "session_id": session_id,
-            "data": {
-                "version": NUDGE_COMMAND_VERSION,
-                "id": NUDGE_COMMAND_ID,
-                "name": "nudge",
-                "type": 1,
-                "options": [{"type": 3, "name": "tag", "value": tag_value}]
-            },
-            "nonce": nonce,
-            "analytics_location": "slash_ui"
-        }
+        payload = _TAG_PAYLOADS[tag_value]
+        payload["session_id"] = os.urandom(16).hex()
+        payload["nonce"] = str(int(time.time() * 1000000))
         
         log(f"   🎯 Tag: {tag_value} (#{attempt_num})")
         
         async with session.post("https://discord.com/api/v10/interactions", 
-                                json=payload, headers=headers) as response:
+                                data=_json_dumps(payload), headers=headers) as response:
             if response.status in [200, 204]:
-                log(f"   ✅ Success", "NET")
+                log(f"   ✅ Success: {tag_value} (#{attempt_num})", "NET")
                 return True
             else:
-                log(f"   ❌ Failed: {response.status}", "WARN")
+                log(f"   ❌ Failed: {tag_value} (#{attempt_num}): {response.status}", "WARN")
                 return False
     except Exception as e:
-        log(f"   ❌ Error: {e}", "WARN")
+        log(f"   ❌ Error: {tag_value} (#{attempt_num}): {e}", "WARN")
         return False
 
+async def _delayed_nudge(session, tag_value, attempt_num, headers, delay):
+    """Send a single nudge command after a random delay"""
+    import asyncio
+    await asyncio.sleep(delay)
+    return await send_nudge_interaction(session, tag_value, attempt_num, headers)
+
 async def execute_nudge_sequence():
     """Execute all nudge commands - acquires wake-lock only during this operation"""
+    import asyncio
     log("🕐 Starting nudge sequence", "ACTION")
     
     # Acquire wake-lock only during network operations
     acquire_wakelock()
     
-    headers = {
-        "Authorization": USER_TOKEN,
-        "Content-Type": "application/json",
-        "User-Agent": "Mozilla/5.0 (Linux; Android 10; K) AppleWebKit/537.36",
-        "Accept": "*/*",
-        "Origin": "https://discord.com"
-    }
-    
     try:
-        async with aiohttp.ClientSession() as session:
-            success_count = 0
-            for i, tag in enumerate(TAGS):
-                if await send_nudge_interaction(session, tag, i+1, headers):
-                    success_count += 1
-                # Short random delay between commands
-                await asyncio.sleep(random.randint(5, 15))
-            
-            log(f"✅ Complete: {success_count}/{len(TAGS)} successful", "ACTION")
+        session = await _session()
+        # Send all commands concurrently, each after its own random delay, so
+        # the wake-lock is held ~10s instead of a minute of sequential sleeps
+        results = await asyncio.gather(*[
+            _delayed_nudge(session, tag, i+1, _NUDGE_HEADERS, random.uniform(0, 10))
+            for i, tag in enumerate(TAGS)
+        ])
+        success_count = sum(results)
+        
+        log(f"✅ Complete: {success_count}/{len(TAGS)} successful", "ACTION")
     finally:
-        # Always release wake-lock after operations
+        # Write out the whole burst of log lines in one go, then always
+        # release wake-lock after operations
+        sys.stdout.flush()
         release_wakelock()
 
+# clock_nanosleep(2) arguments - the clock is the one time.monotonic() reads,
+# so deadlines can be passed straight through (None on Windows)
+_CLOCK_MONOTONIC = getattr(time, 'CLOCK_MONOTONIC', None)
+_TIMER_ABSTIME = 1
+
+# (clock_nanosleep, timespec) bound from libc on first sleep, False if unavailable
+_CLOCK_NANOSLEEP = None
+
+def _clock_nanosleep():
+    """Bind libc clock_nanosleep via ctypes on first use (None where unavailable)"""
+    global _CLOCK_NANOSLEEP
+    if _CLOCK_NANOSLEEP is None:
+        _CLOCK_NANOSLEEP = False
+        if _CLOCK_MONOTONIC is not None:
+            try:
+                import ctypes
+                
+                class timespec(ctypes.Structure):
+                    _fields_ = [("tv_sec", ctypes.c_long), ("tv_nsec", ctypes.c_long)]
+                
+                fn = ctypes.CDLL(None).clock_nanosleep
+                fn.argtypes = [ctypes.c_int, ctypes.c_int,
+                               ctypes.POINTER(timespec), ctypes.POINTER(timespec)]
+                fn.restype = ctypes.c_int
+                _CLOCK_NANOSLEEP = (fn, timespec)
+            except (OSError, AttributeError):
+                pass
+    return _CLOCK_NANOSLEEP or None
+
+def _sleep_until(deadline):
+    """
+    Sleep until an absolute time.monotonic() deadline.
+    Uses clock_nanosleep(CLOCK_MONOTONIC, TIMER_ABSTIME) so a signal that
+    interrupts the sleep can't make it drift; falls back to time.sleep.
+    """
+    libc = _clock_nanosleep()
+    if libc is None:
+        remaining = deadline - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+        return
+    
+    clock_nanosleep, timespec = libc
+    ts = timespec(int(deadline), int((deadline % 1) * 1e9))
+    # On EINTR, sleep again towards the same absolute deadline
+    rc = errno.EINTR
+    while rc == errno.EINTR:
+        rc = clock_nanosleep(_CLOCK_MONOTONIC, _TIMER_ABSTIME, ts, None)
+    if rc == 0:
+        return
+    
+    # Any other error would return early and make the scheduler loop hot,
+    # so fall back to a plain relative sleep for the rest of the time
+    log(f"⚠️ clock_nanosleep failed: {os.strerror(rc)}", "WARN")
+    remaining = deadline - time.monotonic()
+    if remaining > 0:
+        time.sleep(remaining)
+
+# Shutdown signals, delivered through a signalfd on Linux (see _open_signalfd)
+_SHUTDOWN_SIGNALS = (signal.SIGINT, signal.SIGTERM)
+# ...plus SIGALRM from the status timer in battery_efficient_sleep
+_SIGNALFD_SIGNALS = _SHUTDOWN_SIGNALS + ((signal.SIGALRM,) if hasattr(signal, 'SIGALRM') else ())
+_SIGNAL_FD = None
+_shutting_down = False
+
+def shutdown(sig=None, frame=None):
+    """Release resources and exit - safe to call more than once"""
+    global _shutting_down
+    if _shutting_down:
+        return
+    _shutting_down = True
+    log("\n🛑 Shutting down gracefully...", "SYSTEM")
+    release_wakelock()
+    close_session()
+    sys.exit(0)
+
+def _open_signalfd():
+    """
+    Block SIGINT/SIGTERM/SIGALRM and route them to a signalfd (Linux/Android).
+    Returns the fd, or None where signalfd isn't available. The signal module
+    has no signalfd binding, so it's called through ctypes. Must run before
+    any threads start so they inherit the blocked mask.
+    """
+    if os.name == 'nt':
+        return None
+    try:
+        import ctypes
+        libc = ctypes.CDLL(None, use_errno=True)
+        mask = ctypes.create_string_buffer(128)  # Large enough for any sigset_t
+        libc.sigemptyset(mask)
+        for sig in _SIGNALFD_SIGNALS:
+            libc.sigaddset(mask, sig)
+        signalfd = libc.signalfd
+    except (OSError, AttributeError):
+        return None
+    
+    signal.pthread_sigmask(signal.SIG_BLOCK, _SIGNALFD_SIGNALS)
+    fd = signalfd(-1, mask, os.O_CLOEXEC)
+    if fd < 0:
+        signal.pthread_sigmask(signal.SIG_UNBLOCK, _SIGNALFD_SIGNALS)
+        return None
+    # A stale SIGALRM mustn't kill the process if the block is briefly lifted
+    # (see _run_termux_command); unlike SIG_IGN, this isn't inherited on exec
+    signal.signal(signal.SIGALRM, lambda signum, frame: None)
+    return fd
+
+def _read_signal():
+    """Read the number of the next pending signal from the signalfd"""
+    info = os.read(_SIGNAL_FD, 128)  # struct signalfd_siginfo
+    return int.from_bytes(info[:4], sys.byteorder)
+
+def _cancel_on_signal(task):
+    """Event loop reader for the signalfd: cancel the running burst, then exit"""
+    sig = _read_signal()
+    if sig == signal.SIGALRM:
+        return  # Left over from the last sleep's status timer
+    task.cancel()
+    shutdown(sig)
+
+def _wait_for_signals(deadline, on_alarm=None):
+    """
+    Wait on the signalfd until an absolute time.monotonic() deadline.
+    Shuts down as soon as SIGINT/SIGTERM arrives and calls on_alarm for each
+    SIGALRM; a past deadline just polls.
+    """
+    while True:
+        timeout = deadline - time.monotonic()
+        ready, _, _ = select.select([_SIGNAL_FD], [], [], max(timeout, 0))
+        if ready:
+            sig = _read_signal()
+            if sig != signal.SIGALRM:
+                shutdown(sig)
+            elif on_alarm is not None:
+                on_alarm()
+        if timeout <= 0:
+            return
+
+# Interval between status updates during long sleeps
+STATUS_INTERVAL = 3600  # 1 hour
+
 def battery_efficient_sleep(seconds):
     """
     Sleep in a battery-efficient way.
@@ -506,19 +894,36 @@ def battery_efficient_sleep(seconds):
         return
     
     log(f"💤 Sleeping for {seconds/60:.1f} minutes ({seconds/3600:.2f} hours)", "POWER")
+    sys.stdout.flush()
     
-    # For very long sleeps (> 1 hour), break into chunks for status updates
-    max_chunk = 3600  # 1 hour max chunks
+    deadline = time.monotonic() + seconds
     
-    remaining = seconds
-    while remaining > 0:
-        sleep_time = min(remaining, max_chunk)
-        time.sleep(sleep_time)
-        remaining -= sleep_time
-        
-        # Log status for long sleeps
+    def log_remaining():
+        remaining = deadline - time.monotonic()
         if remaining > 0:
             log(f"   ⏰ {remaining/3600:.1f}h remaining", "POWER")
+            sys.stdout.flush()
+    
+    if _SIGNAL_FD is not None:
+        # One select() on the signalfd straight to the absolute deadline.
+        # A kernel interval timer raises SIGALRM for the hourly status
+        # updates and it's read from the signalfd like SIGINT/SIGTERM, so
+        # there are no user-space wake-ups in between and no Python handler.
+        signal.setitimer(signal.ITIMER_REAL, STATUS_INTERVAL, STATUS_INTERVAL)
+        try:
+            _wait_for_signals(deadline, log_remaining)
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+        return
+    
+    # Elsewhere, wake hourly for status updates. Every wake-up targets an
+    # absolute monotonic checkpoint, so the total sleep never drifts no
+    # matter how late each wake-up is.
+    checkpoint = deadline - seconds
+    while checkpoint < deadline:
+        checkpoint = min(checkpoint + STATUS_INTERVAL, deadline)
+        _sleep_until(checkpoint)
+        log_remaining()
 
 def run_scheduler():
     """
@@ -536,33 +941,49 @@ def run_scheduler():
     log("⏰ Schedule: 3h (early) → 2h (mid) → 1h (final)", "INIT")
     log("=" * 55, "INIT")
     
-    # Handle graceful shutdown
-    def signal_handler(sig, frame):
-        log("\n🛑 Shutting down gracefully...", "SYSTEM")
-        release_wakelock()
-        sys.exit(0)
-    
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
+    # Pick up where we left off before a restart
+    load_scheduler_state()
+    
+    # Handle graceful shutdown - through a signalfd on Linux, read by the
+    # event loop during a nudge burst and by select() while sleeping;
+    # plain signal handlers elsewhere, and as a backstop for the moments the
+    # block is lifted to spawn a helper
+    global _SIGNAL_FD
+    for sig in _SHUTDOWN_SIGNALS:
+        signal.signal(sig, shutdown)
+    if _SIGNAL_FD is None:
+        _SIGNAL_FD = _open_signalfd()
+        if _SIGNAL_FD is not None:
+            log("🛡️ Shutdown signals routed through signalfd", "INIT")
     
     try:
         while True:
+            # Pick up a shutdown signal that arrived while we were busy
+            if _SIGNAL_FD is not None:
+                _wait_for_signals(time.monotonic())
+            
+            # Snapshot the clock once and share it across this tick
+            ctx = _compute_clock_context()
+            
             # Calculate optimal sleep duration
-            sleep_seconds, reason, execute_now = calculate_sleep_duration()
+            sleep_seconds, reason, execute_now = calculate_sleep_duration(ctx)
             
-            active, status = is_war_day_active()
+            active, status = is_war_day_active(ctx)
             log(f"📊 Status: {status}", "STATUS")
             log(f"📋 {reason}", "STATUS")
             
             if execute_now:
                 # Time to execute - run nudge sequence
-                asyncio.run(execute_nudge_sequence())
+                run_async(execute_nudge_sequence())
+                
+                # The nudge sequence takes a while, so take a fresh snapshot
+                ctx = _compute_clock_context()
                 
                 # Mark this interval as executed (prevents re-execution)
-                mark_interval_executed()
+                mark_interval_executed(ctx)
                 
                 # Recalculate sleep duration (will now show time until next interval)
-                sleep_seconds, reason, _ = calculate_sleep_duration()
+                sleep_seconds, reason, _ = calculate_sleep_duration(ctx)
                 log(f"📋 {reason}", "STATUS")
                 
                 if sleep_seconds > 0:
@@ -574,6 +995,7 @@ def run_scheduler():
     except KeyboardInterrupt:
         log("\n🛑 Stopped by user", "SYSTEM")
         release_wakelock()
+        close_session()
 
 if __name__ == "__main__":
     log("Discord CW2 STATS Bot - Battery Optimized", "INIT")
@@ -590,7 +1012,7 @@ if __name__ == "__main__":
     
     # Send startup message
     log("Sending startup message...", "INIT")
-    asyncio.run(send_startup_message())
+    send_startup_message()
     
     # Start the event-based scheduler
     log("Starting battery-efficient scheduler...", "INIT")